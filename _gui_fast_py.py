@@ -0,0 +1,31 @@
+"""
+Pure-Python row building for the deployments Treeview.
+
+This is the fallback used when the Cython extension built from gui_fast.pyx
+is not available. Both modules must stay behaviourally identical.
+"""
+
+
+def build_row(dep):
+    """
+    Build the Treeview values, lowercase search blob and status tag for a deployment.
+    """
+    dep_id = dep.get("id")
+    dep_ref = dep.get("ref")
+    dep_env = dep.get("environment", "")
+    dep_status = dep.get("state", "unknown")
+
+    # GitHub always sends YYYY-MM-DDTHH:MM:SSZ, so slicing replaces strptime/strftime
+    created_at = dep.get("created_at", "")
+    if isinstance(created_at, str) and len(created_at) >= 16 and created_at[10] == "T":
+        created_at = f"{created_at[0:10]} {created_at[11:16]}"
+
+    # Format actions based on status
+    if dep_status == "inactive":
+        actions = "Delete"
+    else:
+        actions = "Mark Inactive | Delete"
+
+    values = (dep_id, dep_ref, dep_env, dep_status, created_at, actions)
+    search_blob = f"{dep_id} {dep_ref} {dep_env} {dep_status}".lower()
+    return values, search_blob, str(dep_status)
@@ -1,18 +1,52 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import asyncio
+import contextlib
+from functools import partial
+import random
+import time
 import httpx
 import threading
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from tkinter.font import Font
 import webbrowser
-from datetime import datetime
 import json
 from dotenv import load_dotenv
 import sys
 
+# orjson parses API responses several times faster; fall back to the stdlib if missing
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+# Numba accelerates text filtering on very large listings; it is optional
+try:
+    import numpy as np
+    from numba import njit, prange
+except ImportError:
+    np = None
+    njit = None
+
+# Per-row formatting is compiled with Cython when gui_fast has been built (see setup.py)
+try:
+    from gui_fast import build_row
+except ImportError:
+    from _gui_fast_py import build_row
+
 # Load the .env file from one directory above the current file's directory (root of the project)
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
@@ -48,81 +82,546 @@ THEME = {
     "border_color": COLORS["border"],
 }
 
+# Treeview row background per deployment state
+STATUS_TAG_COLORS = {
+    "success": "#d4edda",
+    "failure": "#f8d7da",
+    "error": "#f8d7da",
+    "inactive": "#e2e3e5",
+    "pending": "#fff3cd",
+    "queued": "#fff3cd",
+    "in_progress": "#fff3cd",
+    "waiting": "#fff3cd",
+    "unknown": "#fff3cd",
+}
+
+
+def status_tag(state: str) -> str:
+    """Return the Treeview tag for a state, falling back to "unknown" for unlisted ones."""
+    return state if state in STATUS_TAG_COLORS else "unknown"
+
+# Body of the status that marks a deployment inactive, shared by every request
+INACTIVE_STATUS = {"state": "inactive"}
+
+# The only deployment fields the GUI reads; everything else GitHub sends is dropped
+DEPLOYMENT_FIELDS = ("id", "ref", "environment", "state", "created_at", "statuses_url")
+
+# GraphQL returns each deployment's latest status inline, saving one request per deployment
+GRAPHQL_URL = "https://api.github.com/graphql"
+GRAPHQL_QUERY = """
+query($owner: String!, $name: String!, $environments: [String!], $after: String) {
+  repository(owner: $owner, name: $name) {
+    deployments(first: 100, after: $after, environments: $environments,
+                orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { databaseId ref { name } commitOid environment createdAt latestStatus { state } }
+    }
+  }
+}
+"""
+
+# Row count above which text filtering switches to the compiled matcher
+NUMBA_FILTER_THRESHOLD = 500
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _match_mask(buf, offsets, needle):
+        """Return which of the blobs packed into buf (split at offsets) contain needle."""
+        rows = offsets.shape[0] - 1
+        size = needle.shape[0]
+        mask = np.zeros(rows, dtype=np.bool_)
+        for row in prange(rows):
+            start = offsets[row]
+            end = offsets[row + 1]
+            for i in range(start, end - size + 1):
+                found = True
+                for k in range(size):
+                    if buf[i + k] != needle[k]:
+                        found = False
+                        break
+                if found:
+                    mask[row] = True
+                    break
+        return mask
+
+# Activity log size limits, in lines: the log is trimmed by LOG_TRIM_LINES once it
+# exceeds LOG_MAX_LINES, and clearing a log longer than LOG_SWAP_LINES replaces its widget
+LOG_MAX_LINES = 20000
+LOG_TRIM_LINES = 1000
+LOG_SWAP_LINES = 5000
+
+# Limits for the asynchronous API fan-out
+API_CONCURRENCY = 16
+# Write requests kept in flight at once: sizes the batch semaphore, the UI worker
+# pool and the session's connection pool alike, and stays low enough not to trip
+# GitHub's secondary rate limits
+MAX_CONCURRENCY = 8
+
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 1.0
+# Longest rate-limit wait worth sitting out; beyond it the response is returned as a failure
+MAX_RETRY_WAIT = 60.0
+
+# Held around each synchronous request so no caller, however it was started,
+# pushes the session past MAX_CONCURRENCY requests in flight
+SESSION_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+# One keep-alive session for the synchronous API calls, pooled as wide as a batch
+# so concurrent callers never hit "Connection pool is full" and drop connections.
+# Transient server errors and 429s are retried by urllib3 with exponential backoff.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=MAX_CONCURRENCY,
+        pool_maxsize=MAX_CONCURRENCY,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "POST", "DELETE"),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+def retry_delay(response, attempt: int):
+    """
+    Return how long to wait before retrying a rate-limited response,
+    or None if the response should not be retried.
+    """
+    if response.status_code not in (403, 429):
+        return None
+
+    retry_after = response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+    reset = response.headers.get("x-ratelimit-reset")
+    if response.headers.get("x-ratelimit-remaining") == "0" and reset:
+        try:
+            return max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            pass
+
+    # A plain 403 without rate limit headers is a permission problem, not throttling
+    if response.status_code == 403:
+        return None
+    return RETRY_BASE_DELAY * 2 ** attempt + random.random()
+
+
+def rate_limit_note(response) -> str:
+    """Describe when an exhausted rate limit resets, for failure messages."""
+    reset = response.headers.get("x-ratelimit-reset")
+    if response.headers.get("x-ratelimit-remaining") != "0" or not reset:
+        return ""
+    try:
+        return f" (rate limit resets at {time.strftime('%H:%M:%S', time.localtime(float(reset)))})"
+    except ValueError:
+        return ""
+
+
+def session_request(method: str, url: str, **kwargs):
+    """
+    Send a request through SESSION, waiting out GitHub's primary rate limit,
+    which arrives as a 403 that urllib3's status retries do not cover.
+    """
+    attempt = 0
+    while True:
+        with SESSION_SLOTS:
+            response = SESSION.request(method, url, **kwargs)
+        delay = retry_delay(response, attempt) if response.status_code == 403 else None
+        if delay is None or attempt >= MAX_RETRIES or delay > MAX_RETRY_WAIT:
+            return response
+        logger.warning(f"Rate limited on {url}, retrying in {delay:.1f}s")
+        attempt += 1
+        time.sleep(delay)
+
+
+async def send_with_retry(client, sem, method: str, url: str, **kwargs):
+    """Send a request under the concurrency semaphore, backing off on rate limits."""
+    attempt = 0
+    while True:
+        async with sem:
+            response = await client.request(method, url, **kwargs)
+        delay = retry_delay(response, attempt)
+        if delay is None or attempt >= MAX_RETRIES or delay > MAX_RETRY_WAIT:
+            return response
+        logger.warning(
+            f"Rate limited on {url} ({response.status_code}), retrying in {delay:.1f}s"
+        )
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+def conditional_headers(etag_cache: dict, url: str) -> dict:
+    """Build If-None-Match headers for a URL whose response has been cached."""
+    if etag_cache is not None and url in etag_cache:
+        return {"If-None-Match": etag_cache[url][0]}
+    return {}
+
+
+def store_etag(etag_cache: dict, url: str, response, body):
+    """Remember the parsed body of a response so a later 304 can reuse it."""
+    etag = response.headers.get("etag")
+    if etag_cache is not None and etag:
+        etag_cache[url] = (etag, body)
+
+
 # Asynchronous function to fetch the latest status for a deployment
-async def fetch_status_async(statuses_url: str) -> str:
+async def fetch_status_async(
+    client: httpx.AsyncClient, sem, statuses_url: str, etag_cache: dict = None
+) -> str:
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(statuses_url, headers=HEADERS)
-            if response.status_code == 200:
-                statuses = response.json()
-                if statuses:
-                    return statuses[0].get("state", "pending")
-                else:
-                    return "pending"
+        headers = conditional_headers(etag_cache, statuses_url)
+        response = await send_with_retry(
+            client, sem, "GET", statuses_url, headers=headers
+        )
+        if response.status_code == 304:
+            statuses = etag_cache[statuses_url][1]
+        elif response.status_code == 200:
+            # Only the latest status is ever read, so that is all the cache keeps
+            statuses = json_loads(response.content)[:1]
+            store_etag(etag_cache, statuses_url, response, statuses)
+        else:
+            statuses = None
+
+        if statuses is not None:
+            if statuses:
+                return statuses[0].get("state", "pending")
             else:
-                logger.error(
-                    f"Error fetching status from {statuses_url}: {response.status_code}"
-                )
-                return "unknown"
+                return "pending"
+        else:
+            logger.error(
+                f"Error fetching status from {statuses_url}: {response.status_code}"
+            )
+            return "unknown"
     except Exception as e:
         logger.error(f"Exception fetching status from {statuses_url}: {e}")
         return "unknown"
 
 
-def run_async_tasks(tasks):
-    """Run asynchronous tasks using a new event loop."""
+def make_async_client(on_response=None) -> httpx.AsyncClient:
+    """
+    Create an HTTP/2 client whose connections are shared by every request it sends.
+    on_response, if given, is an async callable run on every response received.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        headers=HEADERS,
+        event_hooks={"response": [on_response]} if on_response else None,
+    )
+
+
+@contextlib.asynccontextmanager
+async def client_scope(client: httpx.AsyncClient = None):
+    """Use the given long-lived client, or open a temporary one for this call."""
+    if client is not None:
+        yield client
+    else:
+        async with make_async_client() as temporary_client:
+            yield temporary_client
+
+
+async def cancel_pending_tasks():
+    """
+    Cancel every other task on the running loop and wait until they finish, so
+    threads blocked on their results are released with a CancelledError.
+    """
+    current = asyncio.current_task()
+    pending = [task for task in asyncio.all_tasks() if task is not current]
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def run_async_tasks(coro, loop: asyncio.AbstractEventLoop = None):
+    """
+    Run a coroutine to completion, on a persistent event loop running in
+    another thread if one is given, otherwise on a new event loop.
+    """
+    if loop is not None:
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
     loop = asyncio.new_event_loop()
     try:
         asyncio.set_event_loop(loop)
-        results = loop.run_until_complete(asyncio.gather(*tasks))
-        return results
+        return loop.run_until_complete(coro)
     finally:
         loop.close()
 
 
-def list_deployments(base_url: str = None):
+class DeploymentListError(Exception):
+    """Raised when GitHub refuses a page of the deployments listing."""
+
+
+class GraphQLUnavailable(Exception):
     """
-    List all deployments along with their latest status fetched asynchronously.
-    If base_url is not provided, it falls back to a default value.
+    Raised when the GraphQL API cannot serve the listing and REST should be used.
+    permanent is True when the token itself cannot use GraphQL, so retrying it
+    on later listings is pointless.
     """
-    if base_url is None:
-        messagebox.showerror("Error", "Repository URL is not defined.")
-        return []
-    
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+# GraphQL error types meaning the token, not the request, is the problem
+GRAPHQL_CAPABILITY_ERRORS = {"FORBIDDEN", "INSUFFICIENT_SCOPES"}
+
+
+def graphql_capability_failure(response, body: dict) -> bool:
+    """Tell whether a failed GraphQL response shows the token cannot use GraphQL."""
+    if response.status_code == 401:
+        return True
+    # A 403 without rate limit headers is a permission problem, not throttling
+    if response.status_code == 403 and retry_delay(response, 0) is None:
+        return True
+    return any(
+        error.get("type") in GRAPHQL_CAPABILITY_ERRORS for error in body.get("errors") or ()
+    )
+
+
+async def iter_graphql_pages(client, sem, base_url: str, environment: str = None):
+    """
+    Yield pages of deployments from the GraphQL API, shaped like the REST
+    ones but with "state" already filled in from each latest status.
+    """
+    # base_url is https://api.github.com/repos/{owner}/{name}/deployments
+    owner, name = base_url.rstrip("/").split("/")[-3:-1]
+    variables = {
+        "owner": owner,
+        "name": name,
+        "environments": [environment] if environment else None,
+        "after": None,
+    }
+    while True:
+        response = await send_with_retry(
+            client, sem, "POST", GRAPHQL_URL,
+            json={"query": GRAPHQL_QUERY, "variables": variables},
+        )
+        body = json_loads(response.content) if response.status_code == 200 else {}
+        repository = (body.get("data") or {}).get("repository")
+        if body.get("errors") or not repository:
+            raise GraphQLUnavailable(
+                f"GraphQL deployments query failed: {response.status_code}{rate_limit_note(response)}",
+                permanent=graphql_capability_failure(response, body),
+            )
+
+        connection = repository["deployments"]
+        page = []
+        for node in connection["nodes"]:
+            status = node.get("latestStatus")
+            page.append({
+                "id": node["databaseId"],
+                # The ref is null once its branch is deleted; REST reports the commit then too
+                "ref": (node.get("ref") or {}).get("name") or node.get("commitOid"),
+                "environment": node.get("environment"),
+                "state": status["state"].lower() if status else "pending",
+                "created_at": node.get("createdAt"),
+                "statuses_url": f"{base_url}/{node['databaseId']}/statuses",
+            })
+        yield page
+
+        if not connection["pageInfo"]["hasNextPage"]:
+            return
+        variables["after"] = connection["pageInfo"]["endCursor"]
+
+
+async def iter_listing_pages(
+    client, sem, base_url: str, url: str, params: dict,
+    etag_cache: dict = None, api_support: dict = None,
+):
+    """
+    Yield pages of deployments, preferring the single-request-per-page GraphQL
+    API and falling back to REST when GraphQL is unavailable for this token or
+    a ref filter (which GraphQL cannot apply) is requested.
+    GraphQL responses carry no ETag, so etag_cache only revalidates REST pages;
+    an unchanged repository is downloaded in full again on the GraphQL path.
+    When api_support is given, a failure showing the token cannot use GraphQL
+    is recorded in it as {"graphql": False} and later listings go straight to
+    REST; other failures, such as an unknown repository or a server error, only
+    fall back to REST for this listing.
+    """
+    if api_support is None:
+        api_support = {}
+    if "ref" not in params and api_support.get("graphql", True):
+        graphql = iter_graphql_pages(client, sem, base_url, params.get("environment"))
+        try:
+            try:
+                first_page = await graphql.__anext__()
+            except StopAsyncIteration:
+                return
+            except GraphQLUnavailable as e:
+                logger.warning(f"{e}; falling back to the REST API")
+                if e.permanent:
+                    api_support["graphql"] = False
+            else:
+                yield first_page
+                try:
+                    async for page in graphql:
+                        yield page
+                except GraphQLUnavailable as e:
+                    raise DeploymentListError(str(e))
+                return
+        finally:
+            await graphql.aclose()
+
+    rest = iter_deployment_pages(client, sem, url, etag_cache)
     try:
-        response = requests.get(base_url, headers=HEADERS, params={"per_page": 100})
-        if response.status_code != 200:
-            error_msg = f"Failed to fetch deployments: {response.status_code}"
+        async for page in rest:
+            yield page
+    finally:
+        await rest.aclose()
+
+
+async def iter_deployment_pages(client, sem, url: str, etag_cache: dict = None):
+    """
+    Yield pages of deployments, following the Link rel="next" header until the
+    last page. Each page is revalidated against etag_cache when one is given.
+    """
+    while url:
+        response = await send_with_retry(
+            client, sem, "GET", url, headers=conditional_headers(etag_cache, url)
+        )
+        if response.status_code == 304:
+            page, next_url = etag_cache[url][1]
+        elif response.status_code == 200:
+            # Keep only the fields the GUI uses, so cached pages and rows stay small
+            page = [
+                {key: deployment[key] for key in DEPLOYMENT_FIELDS if key in deployment}
+                for deployment in json_loads(response.content)
+            ]
+            next_url = response.links.get("next", {}).get("url")
+            store_etag(etag_cache, url, response, (page, next_url))
+        else:
+            error_msg = f"Failed to fetch deployments: {response.status_code}{rate_limit_note(response)}"
             try:
-                error_detail = response.json().get("message", "No details available")
+                error_detail = json_loads(response.content).get("message", "No details available")
                 error_msg += f" - {error_detail}"
             except:
                 pass
-            logger.error(error_msg)
-            return {"error": error_msg}
-        
-        deployments = response.json()
-        
-        if not deployments:
-            return []
+            raise DeploymentListError(error_msg)
 
-        tasks = []
-        deployments_with_tasks = []
-        for deployment in deployments:
-            statuses_url = deployment.get("statuses_url")
-            if statuses_url:
-                tasks.append(fetch_status_async(statuses_url))
-                deployments_with_tasks.append(deployment)
-            else:
-                deployment["state"] = "unknown"
+        # Hand out copies so callers can annotate them without touching the cache
+        yield [dict(deployment) for deployment in page]
+        url = next_url
+
+
+async def fetch_states_async(client, sem, deployments, etag_cache: dict = None, on_ready=None):
+    """
+    Fill in the "state" of each deployment from its latest status.
+    on_ready(batch) is called with each run of deployments, in their original
+    order, as soon as all of their states are known; its results are returned.
+    """
+    ready = [False] * len(deployments)
+    tasks = []
+    for index, deployment in enumerate(deployments):
+        if deployment.get("state"):
+            # Already known, e.g. from the GraphQL listing
+            ready[index] = True
+        elif deployment.get("statuses_url"):
+            tasks.append(_fetch_state_at(client, sem, index, deployment, etag_cache))
+        else:
+            deployment["state"] = "unknown"
+            ready[index] = True
 
-        if tasks:
-            states = run_async_tasks(tasks)
-            # Assign fetched state to each corresponding deployment
-            for deployment, state in zip(deployments_with_tasks, states):
-                deployment["state"] = state
+    results = []
+    next_index = 0
+
+    def _emit_ready_prefix():
+        nonlocal next_index
+        start = next_index
+        while next_index < len(deployments) and ready[next_index]:
+            next_index += 1
+        if on_ready and next_index > start:
+            results.append(on_ready(deployments[start:next_index]))
+
+    _emit_ready_prefix()
+    # Handle statuses as they land rather than waiting for the slowest one
+    for finished in asyncio.as_completed(tasks):
+        ready[await finished] = True
+        _emit_ready_prefix()
+    return results
+
+
+async def _fetch_state_at(client, sem, index: int, deployment: dict, etag_cache: dict):
+    """Store the latest state on a deployment and return its position."""
+    deployment["state"] = await fetch_status_async(
+        client, sem, deployment["statuses_url"], etag_cache
+    )
+    return index
+
+
+def list_deployments(
+    base_url: str = None,
+    etag_cache: dict = None,
+    params: dict = None,
+    on_batch=None,
+    client: httpx.AsyncClient = None,
+    loop: asyncio.AbstractEventLoop = None,
+    api_support: dict = None,
+):
+    """
+    List all deployments along with their latest status, read inline from the
+    GraphQL API when possible and otherwise fetched asynchronously per deployment.
+    If base_url is not provided, it falls back to a default value.
+    When etag_cache is given, responses are revalidated with If-None-Match and
+    unchanged ones are served from the cache.
+    params holds extra query filters (environment, ref) applied by GitHub itself.
+    on_batch(deployments) is called, in listing order, as soon as the states of
+    each run of deployments are known; returning False from it stops the
+    pagination after the current page.
+    client and loop, when given, are a long-lived client and the event loop it
+    belongs to; otherwise a temporary client and loop are used for this call.
+    api_support, when given, remembers across calls whether GraphQL can be used
+    (see iter_listing_pages).
+    """
+    if base_url is None:
+        messagebox.showerror("Error", "Repository URL is not defined.")
+        return []
+    
+    params = {key: value for key, value in (params or {}).items() if value}
+    # The full URL, query included, is the cache key so each filter gets its own ETag
+    url = str(httpx.URL(base_url, params={"per_page": 100, **params}))
 
+    async def _collect():
+        deployments = []
+        # One client for the whole listing so the TLS handshake is paid once
+        sem = asyncio.Semaphore(API_CONCURRENCY)
+        async with client_scope(client) as http:
+            pages = iter_listing_pages(
+                http, sem, base_url, url, params, etag_cache, api_support
+            )
+            try:
+                async for page in pages:
+                    # Drop anything outside the requested filters before probing its status
+                    page = [
+                        deployment for deployment in page
+                        if all(deployment.get(key) == value for key, value in params.items())
+                    ]
+                    results = await fetch_states_async(
+                        http, sem, page, etag_cache, on_ready=on_batch
+                    )
+                    deployments.extend(page)
+                    if False in results:
+                        break
+            finally:
+                await pages.aclose()
         return deployments
+
+    try:
+        return run_async_tasks(_collect(), loop)
+    except DeploymentListError as e:
+        logger.error(str(e))
+        return {"error": str(e)}
     except Exception as e:
         logger.error(f"Error listing deployments: {str(e)}")
         return {"error": f"Failed to list deployments: {str(e)}"}
@@ -135,15 +634,15 @@ def mark_inactive(deployment_id, base_url: str = None):
     if base_url is None:
         messagebox.showerror("Error", "Repository URL is not defined.")
         return False
-    url = f"{base_url}/{deployment_id}/statuses"
-    payload = {"state": "inactive"}
-    response = requests.post(url, headers=HEADERS, json=payload)
+    response = session_request(
+        "POST", f"{base_url}/{deployment_id}/statuses", json=INACTIVE_STATUS
+    )
     if response.status_code == 201:
         logger.info(f"Deployment {deployment_id} marked as inactive.")
         return True
     else:
         logger.error(
-            f"Failed to mark deployment {deployment_id} as inactive: {response.status_code}"
+            f"Failed to mark deployment {deployment_id} as inactive: {response.status_code}{rate_limit_note(response)}"
         )
         return False
 
@@ -155,19 +654,89 @@ def delete_deployment(deployment_id, base_url: str = None):
     if base_url is None:
         messagebox.showerror("Error", "Repository URL is not defined.")
         return False
-    url = f"{base_url}/{deployment_id}"
-    response = requests.delete(url, headers=HEADERS)
+    response = session_request("DELETE", f"{base_url}/{deployment_id}")
     if response.status_code == 204:
         logger.info(f"Deployment {deployment_id} deleted successfully.")
         return True
     else:
         logger.error(
-            f"Failed to delete deployment {deployment_id}: {response.status_code}"
+            f"Failed to delete deployment {deployment_id}: {response.status_code}{rate_limit_note(response)}"
         )
         return False
 
 
+async def mark_inactive_async(client, sem, base_url: str, deployment_id) -> bool:
+    """
+    Mark a deployment as inactive using the shared async client.
+    """
+    try:
+        response = await send_with_retry(
+            client, sem, "POST", f"{base_url}/{deployment_id}/statuses",
+            json=INACTIVE_STATUS,
+        )
+        if response.status_code == 201:
+            logger.info(f"Deployment {deployment_id} marked as inactive.")
+            return True
+        logger.error(
+            f"Failed to mark deployment {deployment_id} as inactive: {response.status_code}{rate_limit_note(response)}"
+        )
+        return False
+    except Exception as e:
+        logger.error(f"Exception marking deployment {deployment_id} as inactive: {e}")
+        return False
+
+
+async def delete_deployment_async(client, sem, base_url: str, deployment_id) -> bool:
+    """
+    Delete a deployment using the shared async client.
+    """
+    try:
+        response = await send_with_retry(
+            client, sem, "DELETE", f"{base_url}/{deployment_id}"
+        )
+        if response.status_code == 204:
+            logger.info(f"Deployment {deployment_id} deleted successfully.")
+            return True
+        logger.error(
+            f"Failed to delete deployment {deployment_id}: {response.status_code}{rate_limit_note(response)}"
+        )
+        return False
+    except Exception as e:
+        logger.error(f"Exception deleting deployment {deployment_id}: {e}")
+        return False
+
+
+async def run_batch_action(
+    deployment_ids,
+    action,
+    base_url: str,
+    on_done=None,
+    client=None,
+    max_workers: int = MAX_CONCURRENCY,
+):
+    """
+    Run an async deployment action for every ID concurrently, with at most
+    max_workers requests in flight and the same rate-limit backoff as the status
+    fetches. on_done(deployment_id, success) is called as each one finishes.
+    Returns the success flags in the order of deployment_ids.
+    """
+    sem = asyncio.Semaphore(max_workers)
+    async with client_scope(client) as http:
+        async def _one(deployment_id):
+            success = await action(http, sem, base_url, deployment_id)
+            if on_done:
+                on_done(deployment_id, success)
+            return success
+
+        return await asyncio.gather(*(_one(i) for i in deployment_ids))
+
+
 class ImprovedGitHubDeploymentGUI(tk.Tk):
+    # Entry indices in the per-row actions menu
+    ROW_MENU_VIEW = 0
+    ROW_MENU_MARK = 2
+    ROW_MENU_DELETE = 3
+
     def __init__(self):
         super().__init__()
         self.title("GitHub Deployment Cleaner")
@@ -183,6 +752,63 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         # Dictionary to store full deployment data keyed by Treeview row ID
         self.tree_data = {}
         
+        # Search index of inserted rows: {row_id: (lowercase_search_blob, lowercase_state)}
+        self._all_rows = {}
+        
+        # Treeview row ID of every displayed deployment, keyed by deployment ID
+        self._row_by_id = {}
+        
+        # Row IDs partitioned by whether their deployment is inactive
+        self._active_rows = set()
+        self._inactive_rows = set()
+        
+        # Deployment IDs returned so far by the load being rendered, in listing order
+        self._seen_ids = {}
+        
+        # Packed (buffer, offsets) copy of the search blobs for the compiled matcher
+        self._blob_index = None
+        
+        # Pending debounced filter and refresh callbacks
+        self._filter_after_id = None
+        self._refresh_after_id = None
+        
+        # Status messages waiting to be written to the activity log
+        self._log_buffer = []
+        self._log_flush_scheduled = False
+        
+        # Results posted by worker threads for the Tk thread: (kind, *args)
+        self._result_q = queue.Queue()
+        
+        # Batches of deployments handed from the fetch worker to the Tk thread
+        self._deployment_queue = queue.Queue()
+        self._draining = False
+        self._load_id = 0
+        self._rendered_load_id = 0
+        
+        # (base_url, params) of the listing the table shows; refreshes of the same
+        # listing are diffed against its rows, any other listing starts from scratch
+        self._listing_key = None
+        self._listing_base_url = None
+        
+        # Persistent event loop and HTTP client, so connections, TLS sessions and
+        # HTTP/2 streams are reused across every request made by the window
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._http = make_async_client(on_response=self.record_rate_limit)
+        SESSION.hooks["response"].append(self.record_session_rate_limit)
+        
+        # Worker threads for the blocking jobs started from the UI
+        self._executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY)
+        
+        # ETag cache of GitHub responses, keyed by URL: {url: (etag, parsed_json)}
+        self._etag_cache = {}
+        
+        # Which optional GitHub APIs work for this token: {"graphql": False} once GraphQL fails
+        self._api_support = {}
+        
+        # Last X-RateLimit-Remaining value seen from GitHub
+        self._rate_limit_remaining = None
+        
         # Load recent repositories
         self.recent_repos = self.load_recent_repos()
         
@@ -197,11 +823,18 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         # Create main GUI layout
         self.create_layout()
         
+        # Build the per-row actions menu once; clicks only reconfigure it
+        self.create_row_menu()
+        
         # Bind events
         self.bind_events()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Load last used repo
         self.load_last_used_repo()
+        
+        # Start dispatching worker results on the main thread
+        self.after(50, self.pump_results)
     
     def create_styles(self):
         """Create custom styles for widgets"""
@@ -326,6 +959,10 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         # Add current repository info to status bar
         self.repo_status_label = ttk.Label(self.status_bar, text="")
         self.repo_status_label.pack(side=tk.RIGHT)
+        
+        # Remaining GitHub API quota, as reported by the last response
+        self.rate_limit_label = ttk.Label(self.status_bar, text="")
+        self.rate_limit_label.pack(side=tk.RIGHT, padx=(0, 10))
     
     def create_repo_config_frame(self, parent):
         """Create the repository configuration panel"""
@@ -358,7 +995,8 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         username_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         
         ttk.Label(username_frame, text="GitHub Username/Organization:").pack(anchor=tk.W)
-        self.entry_username = ttk.Entry(username_frame)
+        self.var_username = tk.StringVar()
+        self.entry_username = ttk.Entry(username_frame, textvariable=self.var_username)
         self.entry_username.pack(fill=tk.X, pady=5)
         
         # Repository field
@@ -366,9 +1004,37 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         repo_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
         
         ttk.Label(repo_frame, text="Repository Name:").pack(anchor=tk.W)
-        self.entry_repo = ttk.Entry(repo_frame)
+        self.var_repo = tk.StringVar()
+        self.entry_repo = ttk.Entry(repo_frame, textvariable=self.var_repo)
         self.entry_repo.pack(fill=tk.X, pady=5)
         
+        # Keep derived URLs in sync with the entries instead of re-reading them per click
+        self._browser_url_prefix = None
+        self._base_url = None
+        self._repo = None
+        # API URL last added to the recent repositories, so repeat calls skip the file write
+        self._recorded_base_url = None
+        self.var_username.trace_add("write", self.on_repo_change)
+        self.var_repo.trace_add("write", self.on_repo_change)
+        
+        # Optional server-side filters
+        query_frame = ttk.Frame(config_frame)
+        query_frame.pack(fill=tk.X)
+        
+        env_frame = ttk.Frame(query_frame)
+        env_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        
+        ttk.Label(env_frame, text="Environment (optional):").pack(anchor=tk.W)
+        self.entry_env = ttk.Entry(env_frame)
+        self.entry_env.pack(fill=tk.X, pady=5)
+        
+        ref_frame = ttk.Frame(query_frame)
+        ref_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        ttk.Label(ref_frame, text="Branch/Reference (optional):").pack(anchor=tk.W)
+        self.entry_ref = ttk.Entry(ref_frame)
+        self.entry_ref.pack(fill=tk.X, pady=5)
+        
         # Button frame with List Deployments and Open in Browser buttons
         button_frame = ttk.Frame(config_frame)
         button_frame.pack(fill=tk.X, pady=(10, 0))
@@ -402,7 +1068,7 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         self.filter_var = tk.StringVar()
         self.filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var)
         self.filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.filter_var.trace("w", self.filter_deployments)
+        self.filter_var.trace("w", self.schedule_filter)
         
         # Status filter
         ttk.Label(filter_frame, text="Status:").pack(side=tk.LEFT, padx=(10, 5))
@@ -456,6 +1122,7 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree_vsb = vsb  # Packing anchor used when the tree is re-shown
         
         # Configure columns
         self.tree.heading("ID", text="ID", command=lambda: self.sort_treeview("ID", False))
@@ -472,6 +1139,10 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         self.tree.column("Created At", width=180, minwidth=150)
         self.tree.column("Actions", width=180, minwidth=150)
         
+        # Configure status colors once rather than on every inserted row
+        for tag, background in STATUS_TAG_COLORS.items():
+            self.tree.tag_configure(tag, background=background)
+        
         # Pack the treeview and scrollbars
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
@@ -482,22 +1153,36 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         tab_frame = ttk.Frame(self.activity_tab, padding=10)
         tab_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Log text area
-        self.log_text = scrolledtext.ScrolledText(tab_frame, wrap=tk.WORD, height=20)
-        self.log_text.pack(fill=tk.BOTH, expand=True)
-        self.log_text.config(state=tk.DISABLED)
-        
         # Control buttons
-        control_frame = ttk.Frame(tab_frame)
-        control_frame.pack(fill=tk.X, pady=(10, 0))
+        self.log_control_frame = ttk.Frame(tab_frame)
+        self.log_control_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=(10, 0))
+        
+        # Log text area
+        self.create_log_text()
         
         ttk.Button(
-            control_frame,
+            self.log_control_frame,
             text="Clear Log",
             style="Secondary.TButton",
             command=self.clear_log
         ).pack(side=tk.RIGHT)
     
+    def create_log_text(self):
+        """Create an empty log text area above the log controls"""
+        self.log_text = scrolledtext.ScrolledText(
+            self.log_control_frame.master, wrap=tk.WORD, height=20
+        )
+        self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.log_text.config(state=tk.DISABLED)
+    
+    def create_row_menu(self):
+        """Create the actions menu shown when clicking a row's Actions cell"""
+        self.row_menu = tk.Menu(self, tearoff=0)
+        self.row_menu.add_command(label="View in Browser")
+        self.row_menu.add_separator()
+        self.row_menu.add_command(label="Mark as Inactive")
+        self.row_menu.add_command(label="Delete Deployment")
+    
     def bind_events(self):
         """Bind all event handlers"""
         self.tree.bind("<ButtonRelease-1>", self.on_tree_click)
@@ -509,8 +1194,8 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         try:
             config_path = os.path.join(os.path.dirname(__file__), "recent_repos.json")
             if os.path.exists(config_path):
-                with open(config_path, 'r') as file:
-                    data = json.load(file)
+                with open(config_path, 'rb') as file:
+                    data = json_loads(file.read())
                     return data.get("repos", [])
             return []
         except Exception as e:
@@ -521,8 +1206,8 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         """Save recent repositories to a config file"""
         try:
             config_path = os.path.join(os.path.dirname(__file__), "recent_repos.json")
-            with open(config_path, 'w') as file:
-                json.dump({"repos": self.recent_repos[:10]}, file)  # Keep only the 10 most recent
+            with open(config_path, 'wb') as file:
+                file.write(json_dumps({"repos": self.recent_repos[:10]}))  # Keep only the 10 most recent
         except Exception as e:
             logger.error(f"Failed to save recent repos: {e}")
     
@@ -584,15 +1269,62 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
     
     def update_status(self, message):
         """Update the status label with a timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         self.status_label.config(text=f"[{timestamp}] {message}")
         
-        # Also log to the text area
+        # Also log to the text area, batching bursts of messages into one write
+        self._log_buffer.append(f"[{timestamp}] {message}\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(100, self.flush_log)
+    
+    def flush_log(self):
+        """Write buffered status messages to the log text area"""
+        self._log_flush_scheduled = False
+        count = len(self._log_buffer)
+        if not count:
+            return
+        text = "".join(self._log_buffer[:count])
+        del self._log_buffer[:count]
+        
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        self.log_text.insert(tk.END, text)
+        # Drop the oldest lines in one chunk once the log outgrows its cap
+        if self.log_line_count() > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{LOG_TRIM_LINES + 1}.0")
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
     
+    def log_line_count(self):
+        """Return the number of lines in the log text area"""
+        return int(self.log_text.index("end-1c").split(".")[0])
+    
+    async def record_rate_limit(self, response):
+        """Remember the core X-RateLimit-Remaining header of every httpx response"""
+        self.note_rate_limit(response.headers)
+    
+    def record_session_rate_limit(self, response, *args, **kwargs):
+        """requests response hook feeding SESSION responses into the same quota display"""
+        self.note_rate_limit(response.headers)
+        return response
+    
+    def note_rate_limit(self, headers):
+        """
+        Queue a quota label update when the core REST quota changes. Runs on
+        worker and event loop threads, which must never wait on Tk.
+        """
+        # GraphQL and other resources report separate budgets in the same header
+        if headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is not None and remaining != self._rate_limit_remaining:
+            self._rate_limit_remaining = remaining
+            self._result_q.put(("call", self.show_rate_limit, remaining))
+    
+    def show_rate_limit(self, remaining):
+        """Show the remaining GitHub API quota in the status bar"""
+        self.rate_limit_label.config(text=f"API requests left: {remaining}")
+    
     def update_repo_status(self):
         """Update repository info in status bar"""
         username = self.entry_username.get().strip()
@@ -604,21 +1336,19 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
             self.repo_status_label.config(text="")
     
     def get_base_url(self):
-        username = self.entry_username.get().strip()
-        repo = self.entry_repo.get().strip()
-        if not username or not repo:
+        if self._base_url is None:
             messagebox.showerror(
                 "Error", "Please enter both GitHub username and repository name."
             )
             return None
         
-        # Add to recent repos
-        self.add_to_recent_repos(username, repo)
-        
-        # Update status bar
-        self.update_repo_status()
+        # Record the repository once per change rather than on every call
+        if self._recorded_base_url != self._base_url:
+            self._recorded_base_url = self._base_url
+            self.add_to_recent_repos(*self._repo)
+            self.update_repo_status()
         
-        return f"https://api.github.com/repos/{username}/{repo}/deployments"
+        return self._base_url
     
     def open_in_browser(self):
         """Open the repository in browser"""
@@ -633,27 +1363,30 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         url = f"https://github.com/{username}/{repo}/deployments"
         webbrowser.open(url)
     
+    def schedule_filter(self, *args):
+        """Debounce filter updates so a burst of keystrokes triggers a single pass"""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self.filter_deployments)
+    
     def filter_deployments(self, *args):
         """Filter the displayed deployments based on filter text and status"""
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        
         filter_text = self.filter_var.get().lower()
         status_filter = self.status_filter.get().lower()
         
-        # Clear current display
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        text_mask = self.text_match_mask(filter_text)
         
-        # Re-add items that match the filter
-        for row_id, dep in self.tree_data.items():
-            dep_id = str(dep.get("id", ""))
-            dep_ref = str(dep.get("ref", "")).lower()
-            dep_env = str(dep.get("environment", "")).lower()
-            dep_status = str(dep.get("state", "")).lower()
-            
+        # Detach rows that don't match instead of deleting and re-inserting them
+        for index, (row_id, (blob, dep_status)) in enumerate(self._all_rows.items()):
             # Check if it matches the text filter
-            text_match = (filter_text in dep_id or 
-                      filter_text in dep_ref or 
-                      filter_text in dep_env or 
-                      filter_text in dep_status)
+            if text_mask is not None:
+                text_match = text_mask[index]
+            else:
+                text_match = filter_text in blob
             
             # Check if it matches the status filter
             status_match = True
@@ -661,16 +1394,37 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
                 if status_filter == "active":
                     status_match = dep_status != "inactive"
                 else:
-                    status_match = dep_status.lower() == status_filter.lower()
+                    status_match = dep_status == status_filter
             
             if text_match and status_match:
-                self.display_deployment(dep)
+                self.tree.reattach(row_id, "", "end")
+            else:
+                self.tree.detach(row_id)
         
         # Update count in status
         visible_count = len(self.tree.get_children())
         total_count = len(self.tree_data)
         self.update_status(f"Showing {visible_count} of {total_count} deployments")
     
+    def text_match_mask(self, filter_text):
+        """
+        Match filter_text against every search blob with the Numba kernel.
+        Returns None when the pure-Python scan should be used instead.
+        """
+        if njit is None or not filter_text or len(self._all_rows) <= NUMBA_FILTER_THRESHOLD:
+            return None
+        
+        if self._blob_index is None:
+            encoded = [blob.encode("utf-8") for blob, _ in self._all_rows.values()]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+            np.cumsum([len(blob) for blob in encoded], out=offsets[1:])
+            buf = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+            self._blob_index = (buf, offsets)
+        
+        buf, offsets = self._blob_index
+        needle = np.frombuffer(filter_text.encode("utf-8"), dtype=np.uint8)
+        return _match_mask(buf, offsets, needle)
+    
     def clear_filter(self):
         """Clear all filters"""
         self.filter_var.set("")
@@ -679,27 +1433,27 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
     
     def sort_treeview(self, column, reverse):
         """Sort treeview data when clicking on column headers"""
-        column_index = {
-            "ID": 0, 
-            "Ref": 1, 
-            "Environment": 2, 
-            "Status": 3, 
-            "Created At": 4
+        sort_keys = {
+            "ID": lambda dep: int(dep.get("id") or 0),
+            "Ref": lambda dep: str(dep.get("ref") or ""),
+            "Environment": lambda dep: str(dep.get("environment") or ""),
+            "Status": lambda dep: str(dep.get("state") or ""),
+            # ISO-8601 timestamps sort chronologically as plain strings
+            "Created At": lambda dep: dep.get("created_at") or "",
         }
         
-        if column not in column_index:
+        if column not in sort_keys:
             return
         
-        data = []
-        for item_id in self.tree.get_children(''):
-            values = self.tree.item(item_id, 'values')
-            data.append((values, item_id))
+        # Build keys from the cached deployment dicts instead of querying Tk per row
+        key = sort_keys[column]
+        data = [(key(self.tree_data[item_id]), item_id) for item_id in self.tree.get_children('')]
         
         # Sort data
-        data.sort(key=lambda x: x[0][column_index[column]], reverse=reverse)
+        data.sort(key=lambda x: x[0], reverse=reverse)
         
         # Rearrange items in treeview
-        for index, (values, item_id) in enumerate(data):
+        for index, (_, item_id) in enumerate(data):
             self.tree.move(item_id, '', index)
         
         # Reverse sort next time
@@ -708,93 +1462,212 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
             command=lambda col=column: self.sort_treeview(col, not reverse)
         )
     
-    def display_deployment(self, dep):
-        """Display a single deployment in the treeview"""
-        dep_id = dep.get("id")
-        dep_ref = dep.get("ref")
-        dep_env = dep.get("environment", "")
-        dep_status = dep.get("state", "unknown")
+    def display_deployments(self, deployments, index="end"):
+        """Insert deployments into the treeview with as little Tcl overhead as possible"""
+        # Calling the widget command directly skips ttk's per-call option formatting
+        tk_call = self.tk.call
+        tree_path = self.tree._w
+        
+        for dep in deployments:
+            values, search_blob, dep_status = build_row(dep)
+            
+            # Insert into tree with tag for status color
+            row_id = tk_call(
+                tree_path, "insert", "", index, "-values", values, "-tags", (status_tag(dep_status),)
+            )
+            if index != "end":
+                index += 1
+            
+            # Store the full deployment data for this row
+            self.tree_data[row_id] = dep
+            self._row_by_id[dep.get("id")] = row_id
+            
+            # Index the searchable fields once so filtering never re-lowercases them
+            self._all_rows[row_id] = (search_blob, dep_status.lower())
+            self.set_row_state(row_id, dep_status)
         
+        self._blob_index = None
+
+    @contextlib.contextmanager
+    def frozen_tree(self):
+        """Unmap the treeview while rows change so Tk lays it out once, not per row"""
+        self.tree.pack_forget()
         try:
-            created_at = datetime.strptime(dep.get("created_at", ""), "%Y-%m-%dT%H:%M:%SZ").strftime("%Y-%m-%d %H:%M")
-        except:
-            created_at = dep.get("created_at", "")
-        
-        # Format actions based on status
-        if dep_status == "inactive":
-            actions = "Delete"
-        else:
-            actions = "Mark Inactive | Delete"
-        
-        # Insert into tree with tag for status color
-        row_id = self.tree.insert(
-            "",
-            "end",
-            values=(
-                dep_id,
-                dep_ref,
-                dep_env,
-                dep_status,
-                created_at,
-                actions,
-            ),
-            tags=(dep_status,)
-        )
-        
-        # Store the full deployment data for this row
+            yield
+        finally:
+            self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.tree_vsb)
+
+    def update_deployment_row(self, row_id, dep):
+        """Refresh an existing row in place with new deployment data"""
+        values, search_blob, dep_status = build_row(dep)
+        self.tk.call(self.tree._w, "item", row_id, "-values", values, "-tags", (status_tag(dep_status),))
         self.tree_data[row_id] = dep
-        
-        # Configure tag colors
-        if dep_status == "success":
-            self.tree.tag_configure("success", background="#d4edda")
-        elif dep_status == "failure" or dep_status == "error":
-            self.tree.tag_configure("failure", background="#f8d7da")
-            self.tree.tag_configure("error", background="#f8d7da")
-        elif dep_status == "inactive":
-            self.tree.tag_configure("inactive", background="#e2e3e5")
+        self._all_rows[row_id] = (search_blob, dep_status.lower())
+        self.set_row_state(row_id, dep_status)
+        self._blob_index = None
+
+    def set_row_state(self, row_id, state):
+        """Move a row into the active or inactive partition"""
+        if state == "inactive":
+            self._active_rows.discard(row_id)
+            self._inactive_rows.add(row_id)
         else:
-            self.tree.tag_configure(dep_status, background="#fff3cd")
+            self._inactive_rows.discard(row_id)
+            self._active_rows.add(row_id)
+
+    def remove_deployment_rows(self, row_ids):
+        """Delete rows from the treeview and every cache that refers to them"""
+        if not row_ids:
+            return
+        self.tree.delete(*row_ids)
+        for row_id in row_ids:
+            dep = self.tree_data.pop(row_id, None)
+            if dep is not None:
+                self._row_by_id.pop(dep.get("id"), None)
+            self._all_rows.pop(row_id, None)
+            self._active_rows.discard(row_id)
+            self._inactive_rows.discard(row_id)
+        self._blob_index = None
 
     def list_deployments(self):
         base_url = self.get_base_url()
         if not base_url:
             return
 
+        params = {
+            "environment": self.entry_env.get().strip(),
+            "ref": self.entry_ref.get().strip(),
+        }
+
+        # Rows from another repository or filter must never mix with, or outlive, this listing
+        listing_key = (base_url, tuple(sorted(params.items())))
+        if listing_key != self._listing_key:
+            self.remove_deployment_rows(list(self.tree_data))
+            self._listing_key = listing_key
+            self._listing_base_url = base_url
+
+        # Each load gets an id so batches from a superseded load can be dropped
+        self._load_id += 1
+        load_id = self._load_id
+
+        self.update_status("Fetching deployments...")
+        self.btn_list.config(state=tk.DISABLED)
+
+        def on_batch(batch):
+            self._deployment_queue.put((load_id, "batch", batch))
+            # Stop paginating once a newer load has started
+            return load_id == self._load_id
+
         def task():
-            self.update_status("Fetching deployments...")
-            self.btn_list.config(state=tk.DISABLED)
-            
-            # Clear existing data
-            self.tree.delete(*self.tree.get_children())
-            self.tree_data.clear()
-            
-            deployments = list_deployments(base_url=base_url)
-            
-            # Check for errors
-            if isinstance(deployments, dict) and "error" in deployments:
-                self.update_status(f"Error: {deployments['error']}")
-                messagebox.showerror("Error", deployments["error"])
-                self.btn_list.config(state=tk.NORMAL)
-                return
-            
-            # Process deployments
-            for dep in deployments:
-                self.display_deployment(dep)
+            deployments = list_deployments(
+                base_url=base_url,
+                etag_cache=self._etag_cache,
+                params=params,
+                on_batch=on_batch,
+                client=self._http,
+                loop=self._loop,
+                api_support=self._api_support,
+            )
+            self._deployment_queue.put((load_id, "done", deployments))
+
+        self._executor.submit(task)
+
+        # Tk widgets must only be touched from the main thread, so batches are drained there
+        if not self._draining:
+            self._draining = True
+            self.after(50, self.drain_deployment_queue)
+
+    def drain_deployment_queue(self):
+        """Render batches queued by the fetch worker until the current load is done"""
+        finished = False
+        while True:
+            try:
+                load_id, kind, payload = self._deployment_queue.get_nowait()
+            except queue.Empty:
+                break
+            if load_id != self._load_id:
+                continue
             
-            # Update status with count
-            count = len(deployments)
-            self.update_status(f"Fetched {count} deployments.")
-            self.btn_list.config(state=tk.NORMAL)
+            # Start diffing against the current rows when the new load first reports
+            if load_id != self._rendered_load_id:
+                self._seen_ids = {}
+                self._rendered_load_id = load_id
             
-            # Update status filter dropdown with available statuses
-            statuses = set(["All", "Active", "Inactive"])
+            try:
+                if kind == "batch":
+                    self.show_deployments(payload)
+                else:
+                    finished = True
+                    self.finish_loading(payload)
+            except Exception:
+                # One bad batch must not stop the drain and leave the List button disabled
+                logger.exception(f"Failed to render deployments ({kind})")
+                if finished:
+                    self.btn_list.config(state=tk.NORMAL)
+        
+        if finished:
+            self._draining = False
+        else:
+            self.after(50, self.drain_deployment_queue)
+
+    def show_deployments(self, deployments):
+        """Merge a batch of fetched deployments into the treeview, touching only changed rows"""
+        with self.frozen_tree():
             for dep in deployments:
-                if "state" in dep and dep["state"]:
-                    statuses.add(dep["state"].capitalize())
-            
-            self.status_filter['values'] = sorted(list(statuses))
+                dep_id = dep.get("id")
+                position = len(self._seen_ids)
+                self._seen_ids.setdefault(dep_id)
+                
+                row_id = self._row_by_id.get(dep_id)
+                if row_id is None:
+                    # New deployment: place it where the listing has it
+                    self.display_deployments([dep], index=position)
+                elif self.tree_data[row_id] != dep:
+                    self.update_deployment_row(row_id, dep)
+        
+        self.status_label.config(text=f"Fetched {len(self._seen_ids)} deployments so far...")
 
-        threading.Thread(target=task).start()
+    def finish_loading(self, deployments):
+        """Report the outcome of a finished load"""
+        self.btn_list.config(state=tk.NORMAL)
+        
+        # Check for errors
+        if isinstance(deployments, dict) and "error" in deployments:
+            self.update_status(f"Error: {deployments['error']}")
+            messagebox.showerror("Error", deployments["error"])
+            return
+        
+        # Drop rows for deployments that no longer exist
+        self.remove_deployment_rows([
+            row_id for dep_id, row_id in self._row_by_id.items()
+            if dep_id not in self._seen_ids
+        ])
+        
+        # Keep the search index in listing order, since filtering reattaches rows in its order
+        self._all_rows = {
+            self._row_by_id[dep_id]: self._all_rows[self._row_by_id[dep_id]]
+            for dep_id in self._seen_ids
+            if dep_id in self._row_by_id
+        }
+        self._blob_index = None
+        
+        # Update status with count
+        count = len(deployments)
+        self.update_status(f"Fetched {count} deployments.")
+        
+        # Rows whose state changed or that were just inserted may no longer match the filter
+        if self.filter_var.get() or self.status_filter.get() != "All":
+            self.filter_deployments()
+        
+        # Update status filter dropdown with available statuses
+        statuses = set(["All", "Active", "Inactive"])
+        statuses.update(
+            state.capitalize()
+            for state in (dep.get("state") for dep in self.tree_data.values())
+            if state
+        )
+        
+        self.status_filter['values'] = sorted(list(statuses))
 
     def on_tree_click(self, event):
         region = self.tree.identify("region", event.x, event.y)
@@ -813,100 +1686,197 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
 
         deployment_id = dep.get("id")
         current_status = dep.get("state")
-        base_url = self.get_base_url()
-        if not base_url:
-            return
+        # Act on the repository the row was listed from, even if the entries changed since
+        base_url = self._listing_base_url
 
         # If the user clicks on the "Actions" column
         if col == "#6":  # Actions column
-            # Show a context menu with available actions
-            context_menu = tk.Menu(self, tearoff=0)
-            
-            # Add "View in Browser" option
-            context_menu.add_command(
-                label="View in Browser", 
-                command=lambda: self.open_deployment_in_browser(deployment_id)
+            # Point the shared context menu at this deployment
+            menu = self.row_menu
+            menu.entryconfigure(
+                self.ROW_MENU_VIEW,
+                command=partial(self.open_deployment_in_browser, deployment_id)
             )
             
-            context_menu.add_separator()
-            
-            # Add "Mark Inactive" option if not already inactive
-            if current_status != "inactive":
-                context_menu.add_command(
-                    label="Mark as Inactive", 
-                    command=lambda: self.threaded_mark_inactive(deployment_id, base_url)
-                )
+            # "Mark Inactive" is only available if not already inactive
+            menu.entryconfigure(
+                self.ROW_MENU_MARK,
+                command=partial(self.threaded_mark_inactive, deployment_id, base_url),
+                state=tk.DISABLED if current_status == "inactive" else tk.NORMAL
+            )
             
-            # Add "Delete" option
-            context_menu.add_command(
-                label="Delete Deployment", 
-                command=lambda: self.threaded_delete_deployment(deployment_id, base_url)
+            menu.entryconfigure(
+                self.ROW_MENU_DELETE,
+                command=partial(self.threaded_delete_deployment, deployment_id, base_url)
             )
             
             # Display the menu
             try:
-                context_menu.tk_popup(event.x_root, event.y_root)
+                menu.tk_popup(event.x_root, event.y_root)
             finally:
-                context_menu.grab_release()
+                menu.grab_release()
+
+    def on_repo_change(self, *args):
+        """Recompute the URLs derived from the username and repository entries"""
+        username = self.var_username.get().strip()
+        repo = self.var_repo.get().strip()
+        if username and repo:
+            self._repo = (username, repo)
+            self._base_url = f"https://api.github.com/repos/{username}/{repo}/deployments"
+            self._browser_url_prefix = f"https://github.com/{username}/{repo}/deployments/"
+        else:
+            self._repo = None
+            self._base_url = None
+            self._browser_url_prefix = None
 
     def open_deployment_in_browser(self, deployment_id):
         """Open the deployment in GitHub"""
-        username = self.entry_username.get().strip()
-        repo = self.entry_repo.get().strip()
-        if not username or not repo:
-            return
-            
-        url = f"https://github.com/{username}/{repo}/deployments/{deployment_id}"
-        webbrowser.open(url)
+        if self._browser_url_prefix:
+            webbrowser.open(self._browser_url_prefix + str(deployment_id))
+
+    def schedule_refresh(self):
+        """Refresh the list 250 ms from now, folding rapid repeat requests into one"""
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(250, self.run_scheduled_refresh)
+
+    def run_scheduled_refresh(self):
+        self._refresh_after_id = None
+        self.list_deployments()
+
+    def apply_state_change(self, deployment_id, state):
+        """Set a deployment's state in its row without a network refresh"""
+        row_id = self._row_by_id.get(deployment_id)
+        if row_id is not None:
+            self.update_deployment_row(row_id, {**self.tree_data[row_id], "state": state})
+
+    def remove_deployment(self, deployment_id):
+        """Remove a deployment's row without a network refresh"""
+        row_id = self._row_by_id.get(deployment_id)
+        if row_id is not None:
+            self.remove_deployment_rows([row_id])
+
+    def pump_results(self):
+        """Dispatch results posted by worker threads; runs on the Tk main thread"""
+        try:
+            while True:
+                try:
+                    kind, *args = self._result_q.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    if kind == "error":
+                        messagebox.showerror(*args)
+                    elif kind == "status":
+                        self.update_status(*args)
+                    elif kind == "call":
+                        callback, *callback_args = args
+                        callback(*callback_args)
+                except Exception:
+                    # A failing result must not drop the ones queued behind it
+                    logger.exception(f"Failed to dispatch worker result ({kind})")
+        finally:
+            self.after(50, self.pump_results)
 
     def threaded_mark_inactive(self, deployment_id, base_url):
+        self.update_status(f"Marking deployment {deployment_id} as inactive...")
+
         def task():
-            self.update_status(f"Marking deployment {deployment_id} as inactive...")
-            success = mark_inactive(deployment_id, base_url=base_url)
+            try:
+                success = mark_inactive(deployment_id, base_url=base_url)
+            except Exception as e:
+                # Exceptions would otherwise sit unread on the executor's Future
+                logger.exception(f"Deployment {deployment_id} request failed")
+                self._result_q.put((
+                    "error", "Error", f"Failed to mark deployment {deployment_id} as inactive: {e}"
+                ))
+                self._result_q.put(("status", "Operation failed."))
+                return
             if success:
-                messagebox.showinfo(
-                    "Success", f"Deployment {deployment_id} marked as inactive."
-                )
+                # Only this row changed, so update it instead of re-fetching the list
+                self._result_q.put(("call", self.apply_state_change, deployment_id, "inactive"))
+                # Successes only reach the status bar and log; dialogs are kept for errors
+                self._result_q.put(("status", f"Deployment {deployment_id} marked as inactive."))
             else:
-                messagebox.showerror(
-                    "Error", f"Failed to mark deployment {deployment_id} as inactive."
-                )
-            self.update_status("Operation complete.")
-            self.list_deployments()
+                self._result_q.put((
+                    "error", "Error", f"Failed to mark deployment {deployment_id} as inactive."
+                ))
+                self._result_q.put(("call", self.schedule_refresh))
+                self._result_q.put(("status", "Operation complete."))
 
-        threading.Thread(target=task).start()
+        self._executor.submit(task)
 
-    def threaded_delete_deployment(self, deployment_id, base_url):
-        if not messagebox.askyesno(
+    def threaded_delete_deployment(self, deployment_id, base_url, confirm=True):
+        """
+        Delete a deployment in the background. Callers that already asked the
+        user, such as multi-row actions, pass confirm=False to skip the dialog.
+        """
+        if confirm and not messagebox.askyesno(
             "Confirm", f"Are you sure you want to delete deployment {deployment_id}?\nThis action cannot be undone."
         ):
             return
 
+        self.update_status(f"Deleting deployment {deployment_id}...")
+
         def task():
-            self.update_status(f"Deleting deployment {deployment_id}...")
-            success = delete_deployment(deployment_id, base_url=base_url)
+            try:
+                success = delete_deployment(deployment_id, base_url=base_url)
+            except Exception as e:
+                # Exceptions would otherwise sit unread on the executor's Future
+                logger.exception(f"Deployment {deployment_id} request failed")
+                self._result_q.put((
+                    "error", "Error", f"Failed to delete deployment {deployment_id}: {e}"
+                ))
+                self._result_q.put(("status", "Operation failed."))
+                return
             if success:
-                messagebox.showinfo(
-                    "Success", f"Deployment {deployment_id} deleted successfully."
-                )
+                # Only this row changed, so remove it instead of re-fetching the list
+                self._result_q.put(("call", self.remove_deployment, deployment_id))
+                # Successes only reach the status bar and log; dialogs are kept for errors
+                self._result_q.put(("status", f"Deployment {deployment_id} deleted successfully."))
             else:
-                messagebox.showerror(
-                    "Error", f"Failed to delete deployment {deployment_id}."
-                )
-            self.update_status("Operation complete.")
-            self.list_deployments()
+                self._result_q.put((
+                    "error", "Error", f"Failed to delete deployment {deployment_id}."
+                ))
+                self._result_q.put(("call", self.schedule_refresh))
+                self._result_q.put(("status", "Operation complete."))
 
-        threading.Thread(target=task).start()
+        self._executor.submit(task)
+    
+    def progress_reporter(self, total):
+        """
+        Return an on_done(deployment_id, success) callback, safe to call from any
+        thread, that shows batch progress in the status bar at most once per
+        pump_results pass.
+        """
+        lock = threading.Lock()
+        progress = {"processed": 0, "scheduled": False}
+        
+        def flush():
+            with lock:
+                progress["scheduled"] = False
+                processed = progress["processed"]
+            # The final report replaces the count once everything is done
+            if processed < total:
+                self.update_status(f"Processed {processed} of {total}")
+        
+        def report(deployment_id, success):
+            with lock:
+                progress["processed"] += 1
+                if progress["scheduled"]:
+                    return
+                progress["scheduled"] = True
+            self._result_q.put(("call", flush))
+        
+        return report
     
     def mark_all_inactive(self):
         """Mark all active deployments as inactive"""
-        base_url = self.get_base_url()
-        if not base_url:
-            return
+        # The displayed rows belong to the listed repository, not necessarily the one typed in
+        base_url = self._listing_base_url
             
         # Count active deployments
-        active_deployments = [dep for _, dep in self.tree_data.items() 
-                             if dep.get("state") != "inactive"]
+        active_deployments = [self.tree_data[row_id] for row_id in self._active_rows]
         
         if not active_deployments:
             messagebox.showinfo("Info", "No active deployments to mark as inactive.")
@@ -918,20 +1888,24 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         ):
             return
             
-        def task():
-            self.update_status(f"Marking {len(active_deployments)} deployments as inactive...")
-            
-            success_count = 0
-            fail_count = 0
+        self.update_status(f"Marking {len(active_deployments)} deployments as inactive...")
+        
+        report = self.progress_reporter(len(active_deployments))
+        
+        def finish(future):
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Batch operation failed: {e}")
+                results = [False] * len(active_deployments)
+            success_count = sum(results)
+            fail_count = len(results) - success_count
             
-            for dep in active_deployments:
-                deployment_id = dep.get("id")
-                success = mark_inactive(deployment_id, base_url=base_url)
-                if success:
-                    success_count += 1
-                else:
-                    fail_count += 1
-                self.update_status(f"Processed {success_count + fail_count} of {len(active_deployments)}")
+            # Update the affected rows locally instead of re-fetching the whole list
+            with self.frozen_tree():
+                for dep, success in zip(active_deployments, results):
+                    if success:
+                        self.apply_state_change(dep.get("id"), "inactive")
             
             # Final report
             message = f"Operation complete. {success_count} deployments marked as inactive."
@@ -940,19 +1914,27 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
                 
             messagebox.showinfo("Operation Complete", message)
             self.update_status(message)
-            self.list_deployments()
-            
-        threading.Thread(target=task).start()
+        
+        # The batch runs on the shared event loop, so no thread blocks waiting for it
+        future = asyncio.run_coroutine_threadsafe(
+            run_batch_action(
+                [dep.get("id") for dep in active_deployments],
+                mark_inactive_async,
+                base_url,
+                on_done=report,
+                client=self._http,
+            ),
+            self._loop,
+        )
+        future.add_done_callback(lambda done: self._result_q.put(("call", finish, done)))
     
     def delete_all_inactive(self):
         """Delete all inactive deployments"""
-        base_url = self.get_base_url()
-        if not base_url:
-            return
+        # The displayed rows belong to the listed repository, not necessarily the one typed in
+        base_url = self._listing_base_url
             
         # Count inactive deployments
-        inactive_deployments = [dep for _, dep in self.tree_data.items() 
-                               if dep.get("state") == "inactive"]
+        inactive_deployments = [self.tree_data[row_id] for row_id in self._inactive_rows]
         
         if not inactive_deployments:
             messagebox.showinfo("Info", "No inactive deployments to delete.")
@@ -965,20 +1947,26 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
         ):
             return
             
-        def task():
-            self.update_status(f"Deleting {len(inactive_deployments)} inactive deployments...")
-            
-            success_count = 0
-            fail_count = 0
+        self.update_status(f"Deleting {len(inactive_deployments)} inactive deployments...")
+        
+        report = self.progress_reporter(len(inactive_deployments))
+        
+        def finish(future):
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"Batch operation failed: {e}")
+                results = [False] * len(inactive_deployments)
+            success_count = sum(results)
+            fail_count = len(results) - success_count
             
-            for dep in inactive_deployments:
-                deployment_id = dep.get("id")
-                success = delete_deployment(deployment_id, base_url=base_url)
-                if success:
-                    success_count += 1
-                else:
-                    fail_count += 1
-                self.update_status(f"Processed {success_count + fail_count} of {len(inactive_deployments)}")
+            # Drop the deleted rows locally instead of re-fetching the whole list
+            with self.frozen_tree():
+                self.remove_deployment_rows([
+                    self._row_by_id[dep.get("id")]
+                    for dep, success in zip(inactive_deployments, results)
+                    if success and dep.get("id") in self._row_by_id
+                ])
             
             # Final report
             message = f"Operation complete. {success_count} deployments deleted."
@@ -987,15 +1975,47 @@ class ImprovedGitHubDeploymentGUI(tk.Tk):
                 
             messagebox.showinfo("Operation Complete", message)
             self.update_status(message)
-            self.list_deployments()
-            
-        threading.Thread(target=task).start()
+        
+        # The batch runs on the shared event loop, so no thread blocks waiting for it
+        future = asyncio.run_coroutine_threadsafe(
+            run_batch_action(
+                [dep.get("id") for dep in inactive_deployments],
+                delete_deployment_async,
+                base_url,
+                on_done=report,
+                client=self._http,
+            ),
+            self._loop,
+        )
+        future.add_done_callback(lambda done: self._result_q.put(("call", finish, done)))
+    
+    def on_close(self):
+        """Cancel in-flight requests, close the shared HTTP client and stop the event loop"""
+        async def _shutdown():
+            # A loop stopped with work pending would leave worker threads waiting forever
+            await cancel_pending_tasks()
+            await self._http.aclose()
+        
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), self._loop).result(timeout=2)
+        except Exception as e:
+            logger.error(f"Failed to close HTTP client: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        SESSION.hooks["response"].remove(self.record_session_rate_limit)
+        self._executor.shutdown(wait=False)
+        self.destroy()
     
     def clear_log(self):
         """Clear the log text area"""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        if self.log_line_count() > LOG_SWAP_LINES:
+            # Replacing a long log's widget is cheaper than deleting its contents.
+            # ScrolledText lives in a frame with its scrollbar; destroy all of it
+            self.log_text.frame.destroy()
+            self.create_log_text()
+        else:
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.delete(1.0, tk.END)
+            self.log_text.config(state=tk.DISABLED)
         self.update_status("Log cleared")
 
 if __name__ == "__main__":
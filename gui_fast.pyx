@@ -0,0 +1,34 @@
+# cython: language_level=3
+"""
+Compiled row building for the deployments Treeview.
+
+Build in place with `python setup.py build_ext --inplace`. _gui_fast_py.py is
+the pure-Python reference used when the extension is not built.
+"""
+
+
+cpdef tuple build_row(object dep):
+    """
+    Build the Treeview values, lowercase search blob and status tag for a deployment.
+    """
+    cdef object dep_id = dep.get("id")
+    cdef object dep_ref = dep.get("ref")
+    cdef object dep_env = dep.get("environment", "")
+    cdef object dep_status = dep.get("state", "unknown")
+    cdef object created_at
+    cdef str actions
+    cdef str search_blob
+
+    # GitHub always sends YYYY-MM-DDTHH:MM:SSZ, so slicing replaces strptime/strftime
+    created_at = dep.get("created_at", "")
+    if isinstance(created_at, str) and len(created_at) >= 16 and created_at[10] == "T":
+        created_at = f"{created_at[0:10]} {created_at[11:16]}"
+
+    # Format actions based on status
+    if dep_status == "inactive":
+        actions = "Delete"
+    else:
+        actions = "Mark Inactive | Delete"
+
+    search_blob = f"{dep_id} {dep_ref} {dep_env} {dep_status}".lower()
+    return (dep_id, dep_ref, dep_env, dep_status, created_at, actions), search_blob, str(dep_status)
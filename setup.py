@@ -0,0 +1,14 @@
+"""
+Builds the optional Cython extension used by gui.py:
+
+    python setup.py build_ext --inplace
+
+gui.py falls back to _gui_fast_py when the extension is not built.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="github-deployment-cleaner-gui",
+    ext_modules=cythonize(["gui_fast.pyx"], language_level=3),
+)